@@ -13,6 +13,12 @@ class FlowNode:
     def connect(self, other: 'FlowNode'):
         self.next.append(other)
 
+    @classmethod
+    def reset_counter(cls):
+        """Сбрасывает нумерацию узлов (вызывается перед каждым разбором),
+        чтобы id оставались плотными и годились как индексы массивов."""
+        cls._counter = 0
+
 
 class StartNode(FlowNode):
     def __init__(self):
@@ -28,6 +34,9 @@ class OperationNode(FlowNode):
     def __init__(self, code: str):
         super().__init__("OP")
         self.code = code  # строка псевдо‑C
+        # служебный узел (/* join */ и т.п.), вставленный парсером;
+        # выставляется при создании, чтобы не искать маркеры в code
+        self.is_service = False
 
 
 class ConditionNode(FlowNode):
@@ -36,3 +45,42 @@ class ConditionNode(FlowNode):
         self.cond_code = cond_code
         self.true_branch: Optional[FlowNode] = None
         self.false_branch: Optional[FlowNode] = None
+        # id узла, из которого идёт back-edge к этому условию;
+        # заполняется в compute_loop_conditions для условий-циклов
+        self._back_from_id: Optional[int] = None
+
+
+def flatten_flow(start: FlowNode, node_count: int):
+    """
+    Превращает граф узлов в плотные массивы по id (structure-of-arrays):
+    nodes[i] — сам узел, is_cond[i] — флаг условия, succ[i] — кортеж id
+    преемников (для условий сначала true/false-ветки, затем next).
+    Обходы по succ работают с int-индексами и не трогают атрибуты
+    объектов; при необходимости такую форму можно скормить и
+    numba/Cython, но для графов в тысячи узлов хватает чистого Python.
+    """
+    nodes: List[Optional[FlowNode]] = [None] * node_count
+    is_cond = bytearray(node_count)
+    succ: List[tuple] = [()] * node_count
+
+    seen = bytearray(node_count)
+    stack = [start]
+    while stack:
+        n = stack.pop()
+        nid = n.id
+        if seen[nid]:
+            continue
+        seen[nid] = 1
+        nodes[nid] = n
+
+        children = []
+        if isinstance(n, ConditionNode):
+            is_cond[nid] = 1
+            if n.true_branch: children.append(n.true_branch)
+            if n.false_branch: children.append(n.false_branch)
+        children.extend(n.next)
+
+        succ[nid] = tuple(c.id for c in children)
+        stack.extend(children)
+
+    return nodes, is_cond, succ
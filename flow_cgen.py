@@ -1,56 +1,91 @@
-# flow_cgen.py
-from typing import Set
-from flow import StartNode, EndNode, OperationNode, ConditionNode, FlowNode
-
-
-class FlowCGenerator:
-    def __init__(self):
-        self.lines = []
-        self.indent_level = 0
-        self.visited: Set[int] = set()
-
-    def indent(self):
-        return "    " * self.indent_level
-
-    def emit(self, line: str):
-        self.lines.append(self.indent() + line)
-
-    def generate(self, start: StartNode) -> str:
-        self.emit("#include <stdio.h>")
-        self.emit("")
-        self.emit("int main() {")
-        self.indent_level += 1
-        self._walk(start)
-        self.emit("return 0;")
-        self.indent_level -= 1
-        self.emit("}")
-        return "\n".join(self.lines)
-
-    def _walk(self, node: FlowNode):
-        if node.id in self.visited:
-            return
-        self.visited.add(node.id)
-
-        if isinstance(node, OperationNode):
-            self.emit(node.code)
-            for nxt in node.next:
-                self._walk(nxt)
-
-        elif isinstance(node, ConditionNode):
-            self.emit(f"if ({node.cond_code}) {{")
-            self.indent_level += 1
-            if node.true_branch:
-                self._walk(node.true_branch)
-            self.indent_level -= 1
-            if node.false_branch:
-                self.emit("} else {")
-                self.indent_level += 1
-                self._walk(node.false_branch)
-                self.indent_level -= 1
-            self.emit("}")
-            for nxt in node.next:
-                self._walk(nxt)
-
-        else:
-            for nxt in node.next:
-                self._walk(nxt)
+# flow_cgen.py
+import io
+from collections import deque
+from flow import StartNode, EndNode, OperationNode, ConditionNode, FlowNode
+
+
+class FlowCGenerator:
+    def __init__(self):
+        # один непрерывный буфер вместо списка строк + финального join
+        self._buf = io.StringIO()
+        self.indent_level = 0
+        # посещённость по плотным id; размер задаётся в generate
+        self.visited = bytearray()
+        # кэш строк отступа по глубине: "    " * k считается один раз
+        self._indents = [""]
+
+    def indent(self):
+        indents = self._indents
+        while len(indents) <= self.indent_level:
+            indents.append(indents[-1] + "    ")
+        return indents[self.indent_level]
+
+    def emit(self, line: str):
+        self._buf.write(f"{self.indent()}{line}\n")
+
+    def generate(self, start: StartNode, node_count: int | None = None) -> str:
+        if node_count is None:
+            node_count = FlowNode._counter
+        self.visited = bytearray(node_count)
+        self.emit("#include <stdio.h>")
+        self.emit("")
+        self.emit("int main() {")
+        self.indent_level += 1
+        self._walk(start)
+        self.emit("return 0;")
+        self.indent_level -= 1
+        self.emit("}")
+        return self._buf.getvalue()
+
+    def _walk(self, node: FlowNode):
+        # Явный стек вместо рекурсии: нет лимита глубины и нет накладных
+        # расходов на кадр вызова для каждого узла. Служебные маркеры
+        # ("else", "dedent", ...) воспроизводят порядок действий
+        # рекурсивного обхода.
+        visited = self.visited
+        emit = self.emit
+        stack = deque()
+        push = stack.append
+        pop = stack.pop
+        push(("enter", node))
+        while stack:
+            action, payload = pop()
+
+            if action == "enter":
+                n = payload
+                if visited[n.id]:
+                    continue
+                visited[n.id] = 1
+
+                if isinstance(n, OperationNode):
+                    emit(n.code)
+                    for nxt in reversed(n.next):
+                        push(("enter", nxt))
+
+                elif isinstance(n, ConditionNode):
+                    emit(f"if ({n.cond_code}) {{")
+                    self.indent_level += 1
+                    # порядок выполнения: true-ветка, dedent,
+                    # [else-блок], "}", затем next — кладём в обратном
+                    for nxt in reversed(n.next):
+                        push(("enter", nxt))
+                    push(("close", None))
+                    if n.false_branch:
+                        push(("dedent", None))
+                        push(("enter", n.false_branch))
+                        push(("else", None))
+                    push(("dedent", None))
+                    if n.true_branch:
+                        push(("enter", n.true_branch))
+
+                else:
+                    for nxt in reversed(n.next):
+                        push(("enter", nxt))
+
+            elif action == "dedent":
+                self.indent_level -= 1
+            elif action == "else":
+                emit("} else {")
+                self.indent_level += 1
+            elif action == "close":
+                emit("}")
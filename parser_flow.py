@@ -1,409 +1,475 @@
-# parser_flow.py
-import ply.lex as lex
-import ply.yacc as yacc
-from flow import StartNode, EndNode, OperationNode, ConditionNode, FlowNode
-
-# ---------- ЛЕКСЕР ----------
-
-reserved = {
-    'begin': 'BEGIN',
-    'end': 'END',
-    'if': 'IF',
-    'then': 'THEN',
-    'else': 'ELSE',
-    'while': 'WHILE',
-    'do': 'DO',
-    'for': 'FOR',
-    'to': 'TO',
-    'downto': 'DOWNTO',
-    'repeat': 'REPEAT',
-    'until': 'UNTIL',
-    'writeln': 'WRITELN',
-    'write': 'WRITE',
-    'readln': 'READLN',
-    'read': 'READ',
-    'var': 'VAR',
-    'integer': 'INTEGER',
-    'real': 'REAL',
-    'boolean': 'BOOLEAN',
-    'and': 'AND',
-    'or': 'OR',
-    'not': 'NOT',
-    'div': 'DIV',
-    'mod': 'MOD',
-}
-
-tokens = [
-    'ID', 'INT', 'FLOAT',
-    'PLUS', 'MINUS', 'TIMES', 'DIVIDE',
-    'ASSIGN',
-    'EQ', 'NE', 'LT', 'LE', 'GT', 'GE',
-    'LPAREN', 'RPAREN',
-    'SEMI', 'COLON', 'COMMA', 'DOT'
-] + list(reserved.values())
-
-t_PLUS   = r'\+'
-t_MINUS  = r'-'
-t_TIMES  = r'\*'
-t_DIVIDE = r'/'
-t_ASSIGN = r':='
-t_EQ     = r'='
-t_NE     = r'<>'
-t_LE     = r'<='
-t_LT     = r'<'
-t_GE     = r'>='
-t_GT     = r'>'
-t_LPAREN = r'\('
-t_RPAREN = r'\)'
-t_SEMI   = r';'
-t_COLON  = r':'
-t_COMMA  = r','
-t_DOT    = r'\.'
-
-t_ignore = ' \t\r'
-
-
-def t_FLOAT(t):
-    r'\d+\.\d+'
-    t.value = float(t.value)
-    return t
-
-
-def t_INT(t):
-    r'\d+'
-    t.value = int(t.value)
-    return t
-
-
-def t_ID(t):
-    r'[A-Za-z_][A-Za-z0-9_]*'
-    lower = t.value.lower()
-    if lower in reserved:
-        t.type = reserved[lower]
-    else:
-        t.value = t.value
-    return t
-
-
-def t_newline(t):
-    r'\n+'
-    t.lexer.lineno += len(t.value)
-
-
-def t_comment(t):
-    r'\{[^}]*\}'
-    pass
-
-
-def t_error(t):
-    raise SyntaxError(f"Illegal character '{t.value[0]}' at line {t.lineno}")
-
-
-lexer = lex.lex()
-
-# ---------- Вспомогательная структура для списков узлов ----------
-
-class FlowSegment:
-    """
-    Часть блок‑схемы: входной узел first и последний узел last.
-    """
-    def __init__(self, first: FlowNode, last: FlowNode):
-        self.first = first
-        self.last = last
-
-
-# ---------- ПАРСЕР ----------
-
-precedence = (
-    ('left', 'OR'),
-    ('left', 'AND'),
-    ('left', 'EQ', 'NE', 'LT', 'LE', 'GT', 'GE'),
-    ('left', 'PLUS', 'MINUS'),
-    ('left', 'TIMES', 'DIVIDE', 'DIV', 'MOD'),
-    ('right', 'NOT'),
-)
-
-def binop_to_c(op: str) -> str:
-    m = {
-        'and': '&&', 'or': '||', 'div': '/', 'mod': '%',
-        '=': '==', '<>': '!=',
-    }
-    return m.get(op.lower(), op)
-
-# expr → строка C
-def make_bin_expr(a: str, op: str, b: str) -> str:
-    return f"({a} {binop_to_c(op)} {b})"
-
-
-# program ::= [var ..;] begin stmt_list end .
-def p_program(p):
-    '''program : opt_var_section BEGIN stmt_list END DOT'''
-    start = StartNode()
-    end = EndNode()
-    seg: FlowSegment = p[3]
-    start.connect(seg.first)
-    seg.last.connect(end)
-    p[0] = FlowSegment(start, end)
-
-
-def p_opt_var_section(p):
-    '''opt_var_section : VAR var_decls
-                       | empty'''
-    p[0] = None
-
-
-def p_var_decls(p):
-    '''var_decls : var_decls var_decl
-                 | var_decl'''
-    pass
-
-
-def p_var_decl(p):
-    '''var_decl : id_list COLON type_name SEMI'''
-    pass
-
-
-def p_type_name(p):
-    '''type_name : INTEGER
-                 | REAL
-                 | BOOLEAN'''
-    p[0] = p[1]
-
-
-def p_id_list(p):
-    '''id_list : ID
-               | id_list COMMA ID'''
-    pass
-
-
-# stmt_list → FlowSegment (цепочка операций)
-def p_stmt_list(p):
-    '''stmt_list : stmt_list SEMI stmt
-                 | stmt'''
-    if len(p) == 2:
-        # один stmt
-        p[0] = p[1] if isinstance(p[1], FlowSegment) else FlowSegment(p[1].first, p[1].last)
-    else:
-        seg1: FlowSegment = p[1]
-        seg2: FlowSegment = p[3]
-        seg1.last.connect(seg2.first)
-        p[0] = FlowSegment(seg1.first, seg2.last)
-
-
-def p_stmt(p):
-    '''stmt : assign_stmt
-            | if_stmt
-            | while_stmt
-            | for_stmt
-            | repeat_stmt
-            | io_stmt
-            | block
-            | empty'''
-    if p[1] is None:
-        # пустой оператор: создадим пустой узел
-        n = OperationNode("/* empty */")
-        p[0] = FlowSegment(n, n)
-    else:
-        p[0] = p[1]
-
-
-def p_block(p):
-    '''block : BEGIN stmt_list END'''
-    p[0] = p[2]
-
-
-def p_assign_stmt(p):
-    '''assign_stmt : ID ASSIGN expr'''
-    code = f"{p[1]} = {p[3]};"
-    node = OperationNode(code)
-    p[0] = FlowSegment(node, node)
-
-
-def p_if_stmt(p):
-    '''if_stmt : IF expr THEN stmt opt_else'''
-    cond_code = p[2]
-    cond_node = ConditionNode(cond_code)
-
-    then_seg: FlowSegment = p[4]
-    cond_node.true_branch = then_seg.first
-
-    if p[5] is not None:
-        else_seg: FlowSegment = p[5]
-        cond_node.false_branch = else_seg.first
-        # объединяем хвосты then/else в один dummy
-        join = OperationNode("/* join */")
-        then_seg.last.connect(join)
-        else_seg.last.connect(join)
-        last = join
-    else:
-        # без else ветка False идёт сразу дальше
-        join = OperationNode("/* join */")
-        cond_node.false_branch = join
-        then_seg.last.connect(join)
-        last = join
-
-    p[0] = FlowSegment(cond_node, last)
-
-
-def p_opt_else(p):
-    '''opt_else : ELSE stmt
-                | empty'''
-    if len(p) == 3:
-        p[0] = p[2]
-    else:
-        p[0] = None
-
-
-def p_while_stmt(p):
-    '''while_stmt : WHILE expr DO stmt'''
-    cond = ConditionNode(p[2])
-    body_seg: FlowSegment = p[4]
-
-    cond.true_branch = body_seg.first
-    body_seg.last.connect(cond)
-    # выход из цикла
-    after = OperationNode("/* after while */")
-    cond.false_branch = after
-
-    p[0] = FlowSegment(cond, after)
-
-
-def p_for_stmt(p):
-    '''for_stmt : FOR ID ASSIGN expr TO expr DO stmt
-                | FOR ID ASSIGN expr DOWNTO expr DO stmt'''
-    var = p[2]
-    start = p[4]
-    end = p[6]
-    downto = (p[5].lower() == 'downto')
-    init = OperationNode(f"{var} = {start};")
-    cond_code = f"{var} >= {end}" if downto else f"{var} <= {end}"
-    cond = ConditionNode(cond_code)
-    body_seg: FlowSegment = p[8]
-    step_code = f"{var}--;" if downto else f"{var}++;"
-    step = OperationNode(step_code)
-
-    init.connect(cond)
-    cond.true_branch = body_seg.first
-    body_seg.last.connect(step)
-    step.connect(cond)
-
-    after = OperationNode("/* after for */")
-    cond.false_branch = after
-
-    p[0] = FlowSegment(init, after)
-
-
-def p_repeat_stmt(p):
-    '''repeat_stmt : REPEAT stmt_list UNTIL expr'''
-    body_seg: FlowSegment = p[2]
-    cond = ConditionNode(p[4])
-    body_seg.last.connect(cond)
-    cond.true_branch = OperationNode("/* after repeat */")
-    cond.false_branch = body_seg.first
-    p[0] = FlowSegment(body_seg.first, cond.true_branch)
-
-
-def p_io_stmt(p):
-    '''io_stmt : WRITELN LPAREN expr_list RPAREN
-               | WRITE LPAREN expr_list RPAREN
-               | READLN LPAREN id_expr_list RPAREN
-               | READ LPAREN id_expr_list RPAREN'''
-    f = p[1].lower()
-    if f in ('writeln', 'write'):
-        fmt = "%d " * len(p[3])
-        fmt = fmt.rstrip()
-        args = ", ".join(p[3])
-        code = f'printf("{fmt}\\n", {args});'
-        node = OperationNode(code)
-    else:
-        code = " ".join(f'scanf("%d", &{v});' for v in p[3])
-        node = OperationNode(code)
-    p[0] = FlowSegment(node, node)
-
-
-def p_expr_list(p):
-    '''expr_list : expr
-                 | expr_list COMMA expr'''
-    if len(p) == 2:
-        p[0] = [p[1]]
-    else:
-        p[0] = p[1]
-        p[0].append(p[3])
-
-
-def p_id_expr_list(p):
-    '''id_expr_list : ID
-                    | id_expr_list COMMA ID'''
-    if len(p) == 2:
-        p[0] = [p[1]]
-    else:
-        p[0] = p[1]
-        p[0].append(p[3])
-
-
-# ===== выражения → просто строки C =====
-
-def p_expr_binop(p):
-    '''expr : expr PLUS expr
-            | expr MINUS expr
-            | expr TIMES expr
-            | expr DIVIDE expr
-            | expr DIV expr
-            | expr MOD expr
-            | expr EQ expr
-            | expr NE expr
-            | expr LT expr
-            | expr LE expr
-            | expr GT expr
-            | expr GE expr
-            | expr AND expr
-            | expr OR expr'''
-    p[0] = make_bin_expr(p[1], p[2], p[3])
-
-
-def p_expr_unary(p):
-    '''expr : MINUS expr %prec NOT
-            | NOT expr'''
-    if p[1] == '-':
-        p[0] = f"(-({p[2]}))"
-    else:
-        p[0] = f"!({p[2]})"
-
-
-def p_expr_group(p):
-    '''expr : LPAREN expr RPAREN'''
-    p[0] = f"({p[2]})"
-
-
-def p_expr_int(p):
-    '''expr : INT'''
-    p[0] = str(p[1])
-
-
-def p_expr_real(p):
-    '''expr : FLOAT'''
-    p[0] = str(p[1])
-
-
-def p_expr_var(p):
-    '''expr : ID'''
-    p[0] = p[1]
-
-
-def p_empty(p):
-    'empty :'
-    p[0] = None
-
-
-def p_error(p):
-    if p:
-        raise SyntaxError(f"Syntax error at '{p.value}'")
-    else:
-        raise SyntaxError("Syntax error at EOF")
-
-
-parser = yacc.yacc()
-
-
-def parse_pascal_to_flow(source: str) -> FlowSegment:
-    return parser.parse(source, lexer=lexer)
+# parser_flow.py
+import re
+from typing import NamedTuple
+
+from flow import StartNode, EndNode, OperationNode, ConditionNode, FlowNode
+
+# ---------- ЛЕКСЕР ----------
+
+reserved = {
+    'begin': 'BEGIN',
+    'end': 'END',
+    'if': 'IF',
+    'then': 'THEN',
+    'else': 'ELSE',
+    'while': 'WHILE',
+    'do': 'DO',
+    'for': 'FOR',
+    'to': 'TO',
+    'downto': 'DOWNTO',
+    'repeat': 'REPEAT',
+    'until': 'UNTIL',
+    'writeln': 'WRITELN',
+    'write': 'WRITE',
+    'readln': 'READLN',
+    'read': 'READ',
+    'var': 'VAR',
+    'integer': 'INTEGER',
+    'real': 'REAL',
+    'boolean': 'BOOLEAN',
+    'and': 'AND',
+    'or': 'OR',
+    'not': 'NOT',
+    'div': 'DIV',
+    'mod': 'MOD',
+}
+
+class Token(NamedTuple):
+    type: str
+    value: object
+    lineno: int
+
+
+# один скомпилированный мастер-шаблон на все токены: сканирование —
+# это re.finditer на C, диспетчеризация — по имени сработавшей группы.
+# Порядок альтернатив важен: FLOAT раньше INT, ':=' раньше ':',
+# '<='/'<>' раньше '<' и т.д.
+_MASTER = re.compile(r"""
+    (?P<COMMENT>\{[^}]*\})
+  | (?P<NEWLINE>\n+)
+  | (?P<SKIP>[ \t\r]+)
+  | (?P<FLOAT>\d+\.\d+)
+  | (?P<INT>\d+)
+  | (?P<ID>[A-Za-z_][A-Za-z0-9_]*)
+  | (?P<ASSIGN>:=)
+  | (?P<LE><=)
+  | (?P<NE><>)
+  | (?P<GE>>=)
+  | (?P<PLUS>\+)
+  | (?P<MINUS>-)
+  | (?P<TIMES>\*)
+  | (?P<DIVIDE>/)
+  | (?P<EQ>=)
+  | (?P<LT><)
+  | (?P<GT>>)
+  | (?P<LPAREN>\()
+  | (?P<RPAREN>\))
+  | (?P<SEMI>;)
+  | (?P<COLON>:)
+  | (?P<COMMA>,)
+  | (?P<DOT>\.)
+  | (?P<MISMATCH>.)
+""", re.VERBOSE)
+
+
+def _tokenize(source: str) -> list[Token]:
+    toks = []
+    append = toks.append
+    lineno = 1
+    for m in _MASTER.finditer(source):
+        kind = m.lastgroup
+        value = m.group()
+        if kind == 'ID':
+            lower = value.lower()
+            if lower in reserved:
+                kind = reserved[lower]
+            append(Token(kind, value, lineno))
+        elif kind == 'SKIP':
+            continue
+        elif kind == 'COMMENT':
+            lineno += value.count('\n')
+        elif kind == 'NEWLINE':
+            lineno += len(value)
+        elif kind == 'INT':
+            append(Token(kind, int(value), lineno))
+        elif kind == 'FLOAT':
+            append(Token(kind, float(value), lineno))
+        elif kind == 'MISMATCH':
+            raise SyntaxError(f"Illegal character '{value}' at line {lineno}")
+        else:
+            append(Token(kind, value, lineno))
+    return toks
+
+
+# ---------- Вспомогательная структура для списков узлов ----------
+
+def service_node(marker: str) -> OperationNode:
+    """Служебный узел (/* join */ и т.п.), не попадающий на схему."""
+    n = OperationNode(marker)
+    n.is_service = True
+    return n
+
+
+class FlowSegment:
+    """
+    Часть блок‑схемы: входной узел first и последний узел last.
+    """
+    def __init__(self, first: FlowNode, last: FlowNode):
+        self.first = first
+        self.last = last
+        # число узлов графа; заполняется в parse_pascal_to_flow
+        # для сегмента всей программы
+        self.node_count = 0
+
+
+# ---------- ПАРСЕР ----------
+
+# тип токена бинарного оператора -> оператор C; тип известен статически,
+# так что .lower() и разбор значения токена не нужны
+_BINOP_C = {
+    'PLUS': '+', 'MINUS': '-', 'TIMES': '*', 'DIVIDE': '/',
+    'DIV': '/', 'MOD': '%',
+    'EQ': '==', 'NE': '!=', 'LT': '<', 'LE': '<=', 'GT': '>', 'GE': '>=',
+    'AND': '&&', 'OR': '||',
+}
+
+
+# пул одинаковых подвыражений: повторяющиеся поддеревья вроде "i" или
+# "(s + i)" представлены одним объектом str (hash-consing)
+_expr_pool: dict[str, str] = {}
+
+def intern_expr(s: str) -> str:
+    return _expr_pool.setdefault(s, s)
+
+# expr → строка C; op — уже оператор C из _BINOP_C
+def make_bin_expr(a: str, op: str, b: str) -> str:
+    return intern_expr(f"({a} {op} {b})")
+
+
+class PascalParser:
+    """
+    Рекурсивный спуск по той же грамматике, что была у yacc-версии.
+    Грамматика LL(1), так что хватает одного токена предпросмотра;
+    приоритеты выражений закодированы уровнями методов:
+    or < and < сравнения < +- < * / div mod < not / унарный минус.
+    """
+
+    def __init__(self, toks):
+        self.toks = toks
+        self.pos = 0
+
+    # --- работа с потоком токенов ---
+
+    def _peek_type(self):
+        pos = self.pos
+        return self.toks[pos].type if pos < len(self.toks) else None
+
+    def _advance(self):
+        tok = self.toks[self.pos]
+        self.pos += 1
+        return tok
+
+    def _expect(self, ttype: str):
+        if self.pos < len(self.toks):
+            tok = self.toks[self.pos]
+            if tok.type == ttype:
+                self.pos += 1
+                return tok
+        self._error()
+
+    def _error(self):
+        if self.pos < len(self.toks):
+            raise SyntaxError(f"Syntax error at '{self.toks[self.pos].value}'")
+        raise SyntaxError("Syntax error at EOF")
+
+    # --- операторы ---
+
+    # program ::= [var ..;] begin stmt_list end .
+    def parse_program(self) -> FlowSegment:
+        self._parse_opt_var_section()
+        self._expect('BEGIN')
+        seg = self._parse_stmt_list()
+        self._expect('END')
+        self._expect('DOT')
+        if self.pos < len(self.toks):
+            self._error()
+
+        start = StartNode()
+        end = EndNode()
+        start.connect(seg.first)
+        seg.last.connect(end)
+        return FlowSegment(start, end)
+
+    def _parse_opt_var_section(self):
+        # объявления переменных на схему не попадают — просто пропускаем
+        if self._peek_type() != 'VAR':
+            return
+        self._advance()
+        # как в старой грамматике: после var минимум одно объявление
+        if self._peek_type() != 'ID':
+            self._error()
+        while self._peek_type() == 'ID':
+            self._advance()
+            while self._peek_type() == 'COMMA':
+                self._advance()
+                self._expect('ID')
+            self._expect('COLON')
+            if self._peek_type() not in ('INTEGER', 'REAL', 'BOOLEAN'):
+                self._error()
+            self._advance()
+            self._expect('SEMI')
+
+    def _parse_stmt_list(self) -> FlowSegment:
+        seg = self._parse_stmt()
+        while self._peek_type() == 'SEMI':
+            self._advance()
+            nxt = self._parse_stmt()
+            seg.last.connect(nxt.first)
+            seg = FlowSegment(seg.first, nxt.last)
+        return seg
+
+    def _parse_stmt(self) -> FlowSegment:
+        t = self._peek_type()
+        if t == 'ID':
+            return self._parse_assign_stmt()
+        if t == 'IF':
+            return self._parse_if_stmt()
+        if t == 'WHILE':
+            return self._parse_while_stmt()
+        if t == 'FOR':
+            return self._parse_for_stmt()
+        if t == 'REPEAT':
+            return self._parse_repeat_stmt()
+        if t in ('WRITELN', 'WRITE', 'READLN', 'READ'):
+            return self._parse_io_stmt()
+        if t == 'BEGIN':
+            self._advance()
+            seg = self._parse_stmt_list()
+            self._expect('END')
+            return seg
+        # пустой оператор: создадим пустой узел
+        n = service_node("/* empty */")
+        return FlowSegment(n, n)
+
+    def _parse_assign_stmt(self) -> FlowSegment:
+        var = self._expect('ID').value
+        self._expect('ASSIGN')
+        expr = self._parse_expr()
+        node = OperationNode(f"{var} = {expr};")
+        return FlowSegment(node, node)
+
+    def _parse_if_stmt(self) -> FlowSegment:
+        self._expect('IF')
+        cond_code = self._parse_expr()
+        self._expect('THEN')
+        then_seg = self._parse_stmt()
+
+        cond_node = ConditionNode(cond_code)
+        cond_node.true_branch = then_seg.first
+
+        if self._peek_type() == 'ELSE':
+            self._advance()
+            else_seg = self._parse_stmt()
+            cond_node.false_branch = else_seg.first
+            # объединяем хвосты then/else в один dummy
+            join = service_node("/* join */")
+            then_seg.last.connect(join)
+            else_seg.last.connect(join)
+        else:
+            # без else ветка False идёт сразу дальше
+            join = service_node("/* join */")
+            cond_node.false_branch = join
+            then_seg.last.connect(join)
+
+        return FlowSegment(cond_node, join)
+
+    def _parse_while_stmt(self) -> FlowSegment:
+        self._expect('WHILE')
+        cond = ConditionNode(self._parse_expr())
+        self._expect('DO')
+        body_seg = self._parse_stmt()
+
+        cond.true_branch = body_seg.first
+        body_seg.last.connect(cond)
+        # выход из цикла
+        after = service_node("/* after while */")
+        cond.false_branch = after
+
+        return FlowSegment(cond, after)
+
+    def _parse_for_stmt(self) -> FlowSegment:
+        self._expect('FOR')
+        var = self._expect('ID').value
+        self._expect('ASSIGN')
+        start = self._parse_expr()
+        if self._peek_type() not in ('TO', 'DOWNTO'):
+            self._error()
+        downto = (self._advance().type == 'DOWNTO')
+        end = self._parse_expr()
+        self._expect('DO')
+        body_seg = self._parse_stmt()
+
+        init = OperationNode(f"{var} = {start};")
+        cond_code = f"{var} >= {end}" if downto else f"{var} <= {end}"
+        cond = ConditionNode(cond_code)
+        step_code = f"{var}--;" if downto else f"{var}++;"
+        step = OperationNode(step_code)
+
+        init.connect(cond)
+        cond.true_branch = body_seg.first
+        body_seg.last.connect(step)
+        step.connect(cond)
+
+        after = service_node("/* after for */")
+        cond.false_branch = after
+
+        return FlowSegment(init, after)
+
+    def _parse_repeat_stmt(self) -> FlowSegment:
+        self._expect('REPEAT')
+        body_seg = self._parse_stmt_list()
+        self._expect('UNTIL')
+        cond = ConditionNode(self._parse_expr())
+        body_seg.last.connect(cond)
+        cond.true_branch = service_node("/* after repeat */")
+        cond.false_branch = body_seg.first
+        return FlowSegment(body_seg.first, cond.true_branch)
+
+    def _parse_io_stmt(self) -> FlowSegment:
+        f = self._advance().type  # WRITELN | WRITE | READLN | READ
+        self._expect('LPAREN')
+        if f in ('WRITELN', 'WRITE'):
+            args_list = [self._parse_expr()]
+            while self._peek_type() == 'COMMA':
+                self._advance()
+                args_list.append(self._parse_expr())
+            fmt = ("%d " * len(args_list)).rstrip()
+            args = ", ".join(args_list)
+            code = f'printf("{fmt}\\n", {args});'
+        else:
+            ids = [self._expect('ID').value]
+            while self._peek_type() == 'COMMA':
+                self._advance()
+                ids.append(self._expect('ID').value)
+            code = " ".join(f'scanf("%d", &{v});' for v in ids)
+        self._expect('RPAREN')
+        node = OperationNode(code)
+        return FlowSegment(node, node)
+
+    # ===== выражения → просто строки C =====
+
+    def _parse_expr(self) -> str:
+        return self._parse_or()
+
+    def _parse_or(self) -> str:
+        left = self._parse_and()
+        while self._peek_type() == 'OR':
+            self._advance()
+            left = make_bin_expr(left, '||', self._parse_and())
+        return left
+
+    def _parse_and(self) -> str:
+        left = self._parse_rel()
+        while self._peek_type() == 'AND':
+            self._advance()
+            left = make_bin_expr(left, '&&', self._parse_rel())
+        return left
+
+    def _parse_rel(self) -> str:
+        left = self._parse_add()
+        while self._peek_type() in ('EQ', 'NE', 'LT', 'LE', 'GT', 'GE'):
+            op = _BINOP_C[self._advance().type]
+            left = make_bin_expr(left, op, self._parse_add())
+        return left
+
+    def _parse_add(self) -> str:
+        left = self._parse_mul()
+        while self._peek_type() in ('PLUS', 'MINUS'):
+            op = _BINOP_C[self._advance().type]
+            left = make_bin_expr(left, op, self._parse_mul())
+        return left
+
+    def _parse_mul(self) -> str:
+        left = self._parse_unary()
+        while self._peek_type() in ('TIMES', 'DIVIDE', 'DIV', 'MOD'):
+            op = _BINOP_C[self._advance().type]
+            left = make_bin_expr(left, op, self._parse_unary())
+        return left
+
+    def _parse_unary(self) -> str:
+        t = self._peek_type()
+        if t == 'MINUS':
+            self._advance()
+            return intern_expr(f"(-({self._parse_unary()}))")
+        if t == 'NOT':
+            self._advance()
+            return intern_expr(f"!({self._parse_unary()})")
+        return self._parse_primary()
+
+    def _parse_primary(self) -> str:
+        t = self._peek_type()
+        if t == 'INT' or t == 'FLOAT':
+            return intern_expr(str(self._advance().value))
+        if t == 'ID':
+            return intern_expr(self._advance().value)
+        if t == 'LPAREN':
+            self._advance()
+            inner = self._parse_expr()
+            self._expect('RPAREN')
+            return intern_expr(f"({inner})")
+        self._error()
+
+
+def simplify_flow(seg: FlowSegment) -> FlowSegment:
+    """
+    Пост-разборное упрощение графа: сквозные служебные узлы (/* join */,
+    /* after while */ и т.п.) с ровно одним выходом выкусываются —
+    рёбра и ветки условий переписываются сразу на реального преемника,
+    а сами узлы становятся недостижимыми. Служебные узлы без выхода
+    (хвосты) остаются как были.
+    """
+    memo: dict[int, FlowNode] = {}
+
+    def resolve(node: FlowNode) -> FlowNode:
+        # конец цепочки сквозных служебных узлов, начиная с node
+        chain = []
+        seen = set()
+        cur = node
+        while (isinstance(cur, OperationNode) and cur.is_service
+               and len(cur.next) == 1
+               and cur.id not in memo and cur.id not in seen):
+            seen.add(cur.id)
+            chain.append(cur)
+            cur = cur.next[0]
+        if cur.id in memo:
+            cur = memo[cur.id]
+        for c in chain:
+            memo[c.id] = cur
+        return cur
+
+    stack = [seg.first]
+    visited = set()
+    while stack:
+        n = stack.pop()
+        if n.id in visited:
+            continue
+        visited.add(n.id)
+        if isinstance(n, ConditionNode):
+            if n.true_branch is not None:
+                n.true_branch = resolve(n.true_branch)
+                stack.append(n.true_branch)
+            if n.false_branch is not None:
+                n.false_branch = resolve(n.false_branch)
+                stack.append(n.false_branch)
+        n.next = [resolve(nx) for nx in n.next]
+        stack.extend(n.next)
+    return seg
+
+
+def parse_pascal_to_flow(source: str) -> FlowSegment:
+    # плотные id с нуля на каждый разбор: обходы могут использовать
+    # bytearray(node_count) вместо set
+    FlowNode.reset_counter()
+    seg = PascalParser(_tokenize(source)).parse_program()
+    seg.node_count = FlowNode._counter
+    return simplify_flow(seg)
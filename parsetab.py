@@ -1,89 +0,0 @@
-
-# parsetab.py
-# This file is automatically generated. Do not edit.
-# pylint: disable=W,C,R
-_tabversion = '3.10'
-
-_lr_method = 'LALR'
-
-_lr_signature = 'leftORleftANDleftEQNELTLEGTGEleftPLUSMINUSleftTIMESDIVIDEDIVMODrightNOTAND ASSIGN BEGIN BOOLEAN COLON COMMA DIV DIVIDE DO DOT DOWNTO ELSE END EQ FLOAT FOR GE GT ID IF INT INTEGER LE LPAREN LT MINUS MOD NE NOT OR PLUS READ READLN REAL REPEAT RPAREN SEMI THEN TIMES TO UNTIL VAR WHILE WRITE WRITELNprogram : opt_var_section BEGIN stmt_list END DOTopt_var_section : VAR var_decls\n                       | emptyvar_decls : var_decls var_decl\n                 | var_declvar_decl : id_list COLON type_name SEMItype_name : INTEGER\n                 | REAL\n                 | BOOLEANid_list : ID\n               | id_list COMMA IDstmt_list : stmt_list SEMI stmt\n                 | stmtstmt : assign_stmt\n            | if_stmt\n            | while_stmt\n            | for_stmt\n            | repeat_stmt\n            | io_stmt\n            | block\n            | emptyblock : BEGIN stmt_list ENDassign_stmt : ID ASSIGN exprif_stmt : IF expr THEN stmt opt_elseopt_else : ELSE stmt\n                | emptywhile_stmt : WHILE expr DO stmtfor_stmt : FOR ID ASSIGN expr TO expr DO stmt\n                | FOR ID ASSIGN expr DOWNTO expr DO stmtrepeat_stmt : REPEAT stmt_list UNTIL exprio_stmt : WRITELN LPAREN expr_list RPAREN\n               | WRITE LPAREN expr_list RPAREN\n               | READLN LPAREN id_expr_list RPAREN\n               | READ LPAREN id_expr_list RPARENexpr_list : expr\n                 | expr_list COMMA exprid_expr_list : ID\n                    | id_expr_list COMMA IDexpr : expr PLUS expr\n            | expr MINUS expr\n            | expr TIMES expr\n            | expr DIVIDE expr\n            | expr DIV expr\n            | expr MOD expr\n            | expr EQ expr\n            | expr NE expr\n            | expr LT expr\n            | expr LE expr\n            | expr GT expr\n            | expr GE expr\n            | expr AND expr\n            | expr OR exprexpr : MINUS expr %prec NOT\n            | NOT exprexpr : LPAREN expr RPARENexpr : INTexpr : FLOATexpr : IDempty :'
-    
-_lr_action_items = {'VAR':([0,],[3,]),'BEGIN':([0,2,4,5,6,7,10,25,30,35,60,78,87,114,123,124,],[-59,5,-3,10,-2,-5,10,10,-4,10,10,10,-6,10,10,10,]),'$end':([1,57,],[0,-1,]),'ID':([3,5,6,7,10,22,23,24,25,30,32,35,36,38,39,40,47,48,49,50,60,61,62,63,64,65,66,67,68,69,70,71,72,73,74,78,79,80,87,108,111,114,116,117,123,124,],[9,21,9,-5,21,43,43,45,21,-4,55,21,43,43,43,43,43,43,85,85,21,43,43,43,43,43,43,43,43,43,43,43,43,43,43,21,43,43,-6,43,119,21,43,43,21,21,]),'IF':([5,10,25,35,60,78,114,123,124,],[22,22,22,22,22,22,22,22,22,]),'WHILE':([5,10,25,35,60,78,114,123,124,],[23,23,23,23,23,23,23,23,23,]),'FOR':([5,10,25,35,60,78,114,123,124,],[24,24,24,24,24,24,24,24,24,]),'REPEAT':([5,10,25,35,60,78,114,123,124,],[25,25,25,25,25,25,25,25,25,]),'WRITELN':([5,10,25,35,60,78,114,123,124,],[26,26,26,26,26,26,26,26,26,]),'WRITE':([5,10,25,35,60,78,114,123,124,],[27,27,27,27,27,27,27,27,27,]),'READLN':([5,10,25,35,60,78,114,123,124,],[28,28,28,28,28,28,28,28,28,]),'READ':([5,10,25,35,60,78,114,123,124,],[29,29,29,29,29,29,29,29,29,]),'END':([5,10,11,12,13,14,15,16,17,18,19,20,33,35,41,42,43,56,58,59,60,75,76,78,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,106,107,109,110,112,113,114,115,120,123,124,125,126,],[-59,-59,34,-13,-14,-15,-16,-17,-18,-19,-20,-21,56,-59,-56,-57,-58,-22,-12,-23,-59,-53,-54,-59,-59,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-55,-27,-30,-31,-32,-33,-34,-24,-59,-26,-25,-59,-59,-28,-29,]),'SEMI':([5,10,11,12,13,14,15,16,17,18,19,20,25,33,35,41,42,43,46,51,52,53,54,56,58,59,60,75,76,78,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,106,107,109,110,112,113,114,115,120,123,124,125,126,],[-59,-59,35,-13,-14,-15,-16,-17,-18,-19,-20,-21,-59,35,-59,-56,-57,-58,35,87,-7,-8,-9,-22,-12,-23,-59,-53,-54,-59,-59,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-55,-27,-30,-31,-32,-33,-34,-24,-59,-26,-25,-59,-59,-28,-29,]),'COLON':([8,9,55,],[31,-10,-11,]),'COMMA':([8,9,41,42,43,55,75,76,81,82,83,84,85,86,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,118,119,],[32,-10,-56,-57,-58,-11,-53,-54,108,-35,108,111,-37,111,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-55,-36,-38,]),'UNTIL':([12,13,14,15,16,17,18,19,20,25,35,41,42,43,46,56,58,59,60,75,76,78,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,106,107,109,110,112,113,114,115,120,123,124,125,126,],[-13,-14,-15,-16,-17,-18,-19,-20,-21,-59,-59,-56,-57,-58,80,-22,-12,-23,-59,-53,-54,-59,-59,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-55,-27,-30,-31,-32,-33,-34,-24,-59,-26,-25,-59,-59,-28,-29,]),'ELSE':([13,14,15,16,17,18,19,20,41,42,43,56,59,60,75,76,78,88,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,104,106,107,109,110,112,113,114,115,120,123,124,125,126,],[-14,-15,-16,-17,-18,-19,-20,-21,-56,-57,-58,-22,-23,-59,-53,-54,-59,114,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-55,-27,-30,-31,-32,-33,-34,-24,-59,-26,-25,-59,-59,-28,-29,]),'ASSIGN':([21,45,],[36,79,]),'MINUS':([22,23,36,37,38,39,40,41,42,43,44,47,48,59,61,62,63,64,65,66,67,68,69,70,71,72,73,74,75,76,77,79,80,82,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,105,106,108,116,117,118,121,122,],[38,38,38,62,38,38,38,-56,-57,-58,62,38,38,62,38,38,38,38,38,38,38,38,38,38,38,38,38,38,-53,-54,62,38,38,62,-39,-40,-41,-42,-43,-44,62,62,62,62,62,62,62,62,-55,62,62,38,38,38,62,62,62,]),'NOT':([22,23,36,38,39,40,47,48,61,62,63,64,65,66,67,68,69,70,71,72,73,74,79,80,108,116,117,],[39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,39,]),'LPAREN':([22,23,26,27,28,29,36,38,39,40,47,48,61,62,63,64,65,66,67,68,69,70,71,72,73,74,79,80,108,116,117,],[40,40,47,48,49,50,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,40,]),'INT':([22,23,36,38,39,40,47,48,61,62,63,64,65,66,67,68,69,70,71,72,73,74,79,80,108,116,117,],[41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,41,]),'FLOAT':([22,23,36,38,39,40,47,48,61,62,63,64,65,66,67,68,69,70,71,72,73,74,79,80,108,116,117,],[42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,42,]),'INTEGER':([31,],[52,]),'REAL':([31,],[53,]),'BOOLEAN':([31,],[54,]),'DOT':([34,],[57,]),'THEN':([37,41,42,43,75,76,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,],[60,-56,-57,-58,-53,-54,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-55,]),'PLUS':([37,41,42,43,44,59,75,76,77,82,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,105,106,118,121,122,],[61,-56,-57,-58,61,61,-53,-54,61,61,-39,-40,-41,-42,-43,-44,61,61,61,61,61,61,61,61,-55,61,61,61,61,61,]),'TIMES':([37,41,42,43,44,59,75,76,77,82,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,105,106,118,121,122,],[63,-56,-57,-58,63,63,-53,-54,63,63,63,63,-41,-42,-43,-44,63,63,63,63,63,63,63,63,-55,63,63,63,63,63,]),'DIVIDE':([37,41,42,43,44,59,75,76,77,82,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,105,106,118,121,122,],[64,-56,-57,-58,64,64,-53,-54,64,64,64,64,-41,-42,-43,-44,64,64,64,64,64,64,64,64,-55,64,64,64,64,64,]),'DIV':([37,41,42,43,44,59,75,76,77,82,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,105,106,118,121,122,],[65,-56,-57,-58,65,65,-53,-54,65,65,65,65,-41,-42,-43,-44,65,65,65,65,65,65,65,65,-55,65,65,65,65,65,]),'MOD':([37,41,42,43,44,59,75,76,77,82,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,105,106,118,121,122,],[66,-56,-57,-58,66,66,-53,-54,66,66,66,66,-41,-42,-43,-44,66,66,66,66,66,66,66,66,-55,66,66,66,66,66,]),'EQ':([37,41,42,43,44,59,75,76,77,82,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,105,106,118,121,122,],[67,-56,-57,-58,67,67,-53,-54,67,67,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,67,67,-55,67,67,67,67,67,]),'NE':([37,41,42,43,44,59,75,76,77,82,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,105,106,118,121,122,],[68,-56,-57,-58,68,68,-53,-54,68,68,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,68,68,-55,68,68,68,68,68,]),'LT':([37,41,42,43,44,59,75,76,77,82,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,105,106,118,121,122,],[69,-56,-57,-58,69,69,-53,-54,69,69,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,69,69,-55,69,69,69,69,69,]),'LE':([37,41,42,43,44,59,75,76,77,82,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,105,106,118,121,122,],[70,-56,-57,-58,70,70,-53,-54,70,70,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,70,70,-55,70,70,70,70,70,]),'GT':([37,41,42,43,44,59,75,76,77,82,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,105,106,118,121,122,],[71,-56,-57,-58,71,71,-53,-54,71,71,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,71,71,-55,71,71,71,71,71,]),'GE':([37,41,42,43,44,59,75,76,77,82,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,105,106,118,121,122,],[72,-56,-57,-58,72,72,-53,-54,72,72,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,72,72,-55,72,72,72,72,72,]),'AND':([37,41,42,43,44,59,75,76,77,82,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,105,106,118,121,122,],[73,-56,-57,-58,73,73,-53,-54,73,73,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,73,-55,73,73,73,73,73,]),'OR':([37,41,42,43,44,59,75,76,77,82,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,105,106,118,121,122,],[74,-56,-57,-58,74,74,-53,-54,74,74,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-55,74,74,74,74,74,]),'DO':([41,42,43,44,75,76,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,121,122,],[-56,-57,-58,78,-53,-54,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-55,123,124,]),'RPAREN':([41,42,43,75,76,77,81,82,83,84,85,86,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,118,119,],[-56,-57,-58,-53,-54,103,107,-35,109,110,-37,112,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-55,-36,-38,]),'TO':([41,42,43,75,76,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,105,],[-56,-57,-58,-53,-54,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-55,116,]),'DOWNTO':([41,42,43,75,76,89,90,91,92,93,94,95,96,97,98,99,100,101,102,103,105,],[-56,-57,-58,-53,-54,-39,-40,-41,-42,-43,-44,-45,-46,-47,-48,-49,-50,-51,-52,-55,117,]),}
-
-_lr_action = {}
-for _k, _v in _lr_action_items.items():
-   for _x,_y in zip(_v[0],_v[1]):
-      if not _x in _lr_action:  _lr_action[_x] = {}
-      _lr_action[_x][_k] = _y
-del _lr_action_items
-
-_lr_goto_items = {'program':([0,],[1,]),'opt_var_section':([0,],[2,]),'empty':([0,5,10,25,35,60,78,88,114,123,124,],[4,20,20,20,20,20,20,115,20,20,20,]),'var_decls':([3,],[6,]),'var_decl':([3,6,],[7,30,]),'id_list':([3,6,],[8,8,]),'stmt_list':([5,10,25,],[11,33,46,]),'stmt':([5,10,25,35,60,78,114,123,124,],[12,12,12,58,88,104,120,125,126,]),'assign_stmt':([5,10,25,35,60,78,114,123,124,],[13,13,13,13,13,13,13,13,13,]),'if_stmt':([5,10,25,35,60,78,114,123,124,],[14,14,14,14,14,14,14,14,14,]),'while_stmt':([5,10,25,35,60,78,114,123,124,],[15,15,15,15,15,15,15,15,15,]),'for_stmt':([5,10,25,35,60,78,114,123,124,],[16,16,16,16,16,16,16,16,16,]),'repeat_stmt':([5,10,25,35,60,78,114,123,124,],[17,17,17,17,17,17,17,17,17,]),'io_stmt':([5,10,25,35,60,78,114,123,124,],[18,18,18,18,18,18,18,18,18,]),'block':([5,10,25,35,60,78,114,123,124,],[19,19,19,19,19,19,19,19,19,]),'expr':([22,23,36,38,39,40,47,48,61,62,63,64,65,66,67,68,69,70,71,72,73,74,79,80,108,116,117,],[37,44,59,75,76,77,82,82,89,90,91,92,93,94,95,96,97,98,99,100,101,102,105,106,118,121,122,]),'type_name':([31,],[51,]),'expr_list':([47,48,],[81,83,]),'id_expr_list':([49,50,],[84,86,]),'opt_else':([88,],[113,]),}
-
-_lr_goto = {}
-for _k, _v in _lr_goto_items.items():
-   for _x, _y in zip(_v[0], _v[1]):
-       if not _x in _lr_goto: _lr_goto[_x] = {}
-       _lr_goto[_x][_k] = _y
-del _lr_goto_items
-_lr_productions = [
-  ("S' -> program","S'",1,None,None,None),
-  ('program -> opt_var_section BEGIN stmt_list END DOT','program',5,'p_program','parser_flow.py',140),
-  ('opt_var_section -> VAR var_decls','opt_var_section',2,'p_opt_var_section','parser_flow.py',150),
-  ('opt_var_section -> empty','opt_var_section',1,'p_opt_var_section','parser_flow.py',151),
-  ('var_decls -> var_decls var_decl','var_decls',2,'p_var_decls','parser_flow.py',156),
-  ('var_decls -> var_decl','var_decls',1,'p_var_decls','parser_flow.py',157),
-  ('var_decl -> id_list COLON type_name SEMI','var_decl',4,'p_var_decl','parser_flow.py',162),
-  ('type_name -> INTEGER','type_name',1,'p_type_name','parser_flow.py',167),
-  ('type_name -> REAL','type_name',1,'p_type_name','parser_flow.py',168),
-  ('type_name -> BOOLEAN','type_name',1,'p_type_name','parser_flow.py',169),
-  ('id_list -> ID','id_list',1,'p_id_list','parser_flow.py',174),
-  ('id_list -> id_list COMMA ID','id_list',3,'p_id_list','parser_flow.py',175),
-  ('stmt_list -> stmt_list SEMI stmt','stmt_list',3,'p_stmt_list','parser_flow.py',181),
-  ('stmt_list -> stmt','stmt_list',1,'p_stmt_list','parser_flow.py',182),
-  ('stmt -> assign_stmt','stmt',1,'p_stmt','parser_flow.py',194),
-  ('stmt -> if_stmt','stmt',1,'p_stmt','parser_flow.py',195),
-  ('stmt -> while_stmt','stmt',1,'p_stmt','parser_flow.py',196),
-  ('stmt -> for_stmt','stmt',1,'p_stmt','parser_flow.py',197),
-  ('stmt -> repeat_stmt','stmt',1,'p_stmt','parser_flow.py',198),
-  ('stmt -> io_stmt','stmt',1,'p_stmt','parser_flow.py',199),
-  ('stmt -> block','stmt',1,'p_stmt','parser_flow.py',200),
-  ('stmt -> empty','stmt',1,'p_stmt','parser_flow.py',201),
-  ('block -> BEGIN stmt_list END','block',3,'p_block','parser_flow.py',211),
-  ('assign_stmt -> ID ASSIGN expr','assign_stmt',3,'p_assign_stmt','parser_flow.py',216),
-  ('if_stmt -> IF expr THEN stmt opt_else','if_stmt',5,'p_if_stmt','parser_flow.py',223),
-  ('opt_else -> ELSE stmt','opt_else',2,'p_opt_else','parser_flow.py',249),
-  ('opt_else -> empty','opt_else',1,'p_opt_else','parser_flow.py',250),
-  ('while_stmt -> WHILE expr DO stmt','while_stmt',4,'p_while_stmt','parser_flow.py',258),
-  ('for_stmt -> FOR ID ASSIGN expr TO expr DO stmt','for_stmt',8,'p_for_stmt','parser_flow.py',272),
-  ('for_stmt -> FOR ID ASSIGN expr DOWNTO expr DO stmt','for_stmt',8,'p_for_stmt','parser_flow.py',273),
-  ('repeat_stmt -> REPEAT stmt_list UNTIL expr','repeat_stmt',4,'p_repeat_stmt','parser_flow.py',297),
-  ('io_stmt -> WRITELN LPAREN expr_list RPAREN','io_stmt',4,'p_io_stmt','parser_flow.py',307),
-  ('io_stmt -> WRITE LPAREN expr_list RPAREN','io_stmt',4,'p_io_stmt','parser_flow.py',308),
-  ('io_stmt -> READLN LPAREN id_expr_list RPAREN','io_stmt',4,'p_io_stmt','parser_flow.py',309),
-  ('io_stmt -> READ LPAREN id_expr_list RPAREN','io_stmt',4,'p_io_stmt','parser_flow.py',310),
-  ('expr_list -> expr','expr_list',1,'p_expr_list','parser_flow.py',325),
-  ('expr_list -> expr_list COMMA expr','expr_list',3,'p_expr_list','parser_flow.py',326),
-  ('id_expr_list -> ID','id_expr_list',1,'p_id_expr_list','parser_flow.py',335),
-  ('id_expr_list -> id_expr_list COMMA ID','id_expr_list',3,'p_id_expr_list','parser_flow.py',336),
-  ('expr -> expr PLUS expr','expr',3,'p_expr_binop','parser_flow.py',347),
-  ('expr -> expr MINUS expr','expr',3,'p_expr_binop','parser_flow.py',348),
-  ('expr -> expr TIMES expr','expr',3,'p_expr_binop','parser_flow.py',349),
-  ('expr -> expr DIVIDE expr','expr',3,'p_expr_binop','parser_flow.py',350),
-  ('expr -> expr DIV expr','expr',3,'p_expr_binop','parser_flow.py',351),
-  ('expr -> expr MOD expr','expr',3,'p_expr_binop','parser_flow.py',352),
-  ('expr -> expr EQ expr','expr',3,'p_expr_binop','parser_flow.py',353),
-  ('expr -> expr NE expr','expr',3,'p_expr_binop','parser_flow.py',354),
-  ('expr -> expr LT expr','expr',3,'p_expr_binop','parser_flow.py',355),
-  ('expr -> expr LE expr','expr',3,'p_expr_binop','parser_flow.py',356),
-  ('expr -> expr GT expr','expr',3,'p_expr_binop','parser_flow.py',357),
-  ('expr -> expr GE expr','expr',3,'p_expr_binop','parser_flow.py',358),
-  ('expr -> expr AND expr','expr',3,'p_expr_binop','parser_flow.py',359),
-  ('expr -> expr OR expr','expr',3,'p_expr_binop','parser_flow.py',360),
-  ('expr -> MINUS expr','expr',2,'p_expr_unary','parser_flow.py',365),
-  ('expr -> NOT expr','expr',2,'p_expr_unary','parser_flow.py',366),
-  ('expr -> LPAREN expr RPAREN','expr',3,'p_expr_group','parser_flow.py',374),
-  ('expr -> INT','expr',1,'p_expr_int','parser_flow.py',379),
-  ('expr -> FLOAT','expr',1,'p_expr_real','parser_flow.py',384),
-  ('expr -> ID','expr',1,'p_expr_var','parser_flow.py',389),
-  ('empty -> <empty>','empty',0,'p_empty','parser_flow.py',394),
-]